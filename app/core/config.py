@@ -9,12 +9,24 @@ class Settings(BaseSettings):
     API_KEY: str
     LOGS_LEVEL: str
     DB_ECHO: bool = True
+    # Часовой пояс пользователей: по нему события раскладываются по дням в сводке
+    TIMEZONE: str = "Europe/Moscow"
 
     CALENDAR_ID: str
     CREDENTIALS_FILE: Path = Path("creds/credentials.json")
     TOKEN_FILE: Path = Path("creds/token.json")
     SCOPES: list[str] = ["https://www.googleapis.com/auth/calendar.readonly"]
 
+    # Предохранитель и дедлайн синхронизации с Google
+    GOOGLE_SYNC_TIMEOUT: float = 10.0
+    GOOGLE_BREAKER_FAILURE_THRESHOLD: int = 3
+    GOOGLE_BREAKER_RECOVERY_TIMEOUT: float = 60.0
+
+    # Журнал изменений событий
+    CHANGES_RETENTION_DAYS: int = 30
+    CHANGES_PRUNE_INTERVAL: float = 3600.0
+    CHANGES_PAGE_LIMIT: int = 500
+
     POSTGRES_SERVER: str
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
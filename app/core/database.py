@@ -1,4 +1,5 @@
 from typing import AsyncGenerator
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncEngine,
@@ -20,6 +21,14 @@ async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 #             await conn.run_sync(SQLModel.metadata.create_all)
 
 
+async def warm_up_db() -> None:
+    """Открывает соединение пула заранее, чтобы первый запрос не платил за connect.
+    Вызывается в lifespan уже в воркере: при gunicorn --preload соединения не должны
+    создаваться в мастер-процессе до fork."""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
         yield session
@@ -1,22 +1,71 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
+
 from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
 from app.route import router
-from app.core import settings
+from app.core import settings, logger
+from app.core.database import engine, warm_up_db
+from app.service import warm_up_calendar, prune_changes_periodically
+
+
+@lru_cache
+def get_templates():
+    # Jinja2 импортируется лениво, шаблон компилируется при прогреве воркера
+    from fastapi.templating import Jinja2Templates
+    return Jinja2Templates(directory="app/templates")
+
+
+async def warm_up() -> None:
+    """Прогрев воркера до того, как он начнет принимать запросы.
+    Ошибки не блокируют старт: БД или Google могут быть еще недоступны."""
+    started = time.perf_counter()
+
+    try:
+        await warm_up_db()
+    except Exception as e:
+        logger.warning(f"Прогрев БД не удался: {e!r}")
+
+    try:
+        loop = asyncio.get_running_loop()
+        await asyncio.wait_for(
+            loop.run_in_executor(None, warm_up_calendar),
+            timeout=settings.GOOGLE_SYNC_TIMEOUT,
+        )
+    except Exception as e:
+        logger.warning(f"Прогрев клиента Google не удался: {e!r}")
+
+    get_templates().get_template("index.html")
+
+    logger.info(f"Прогрев завершен за {time.perf_counter() - started:.3f} с")
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    await warm_up()
+    prune_task = asyncio.create_task(prune_changes_periodically())
+    yield
+    prune_task.cancel()
+    # Дожидаемся отмены, чтобы задача вернула соединение в пул до dispose
+    with suppress(asyncio.CancelledError):
+        await prune_task
+    await engine.dispose()
+
 
 app = FastAPI(
     title="Magos Calendar API",
     swagger_ui_parameters={"persistAuthorization": True},
+    lifespan=lifespan,
 )
 
-templates = Jinja2Templates(directory="app/templates")
-
 app.include_router(router)
 
 @app.get("/", response_class=HTMLResponse, include_in_schema=False)
 async def read_root(request: Request):
-    return templates.TemplateResponse(
+    return get_templates().TemplateResponse(
         request=request,
         name="index.html",
         context={"api_key": settings.API_KEY} # Передаем ключ во фронт
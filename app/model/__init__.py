@@ -1,3 +1,17 @@
-from .event import EventModel, EventRead, EventStatus
+from .event import EventModel, EventRead, EventStatus, EventSearchPage
+from .summary import EventDayCountModel, EventDaySummary, EventMonthSummary
+from .journal import EventChangeModel, EventChangesWatermarkModel, EventChangeRead, EventChangePage
 
-__all__ = ["EventModel", "EventRead", "EventStatus"]
\ No newline at end of file
+__all__ = [
+    "EventModel",
+    "EventRead",
+    "EventStatus",
+    "EventSearchPage",
+    "EventDayCountModel",
+    "EventDaySummary",
+    "EventMonthSummary",
+    "EventChangeModel",
+    "EventChangesWatermarkModel",
+    "EventChangeRead",
+    "EventChangePage",
+]
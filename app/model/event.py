@@ -1,9 +1,9 @@
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
-from sqlalchemy import Column, DateTime, Text, func, BigInteger, Identity
+from sqlalchemy import Column, DateTime, Text, func, BigInteger, Identity, Index, text
 from sqlmodel import Field, SQLModel
 
 
@@ -18,6 +18,14 @@ class EventStatus(str, Enum):
 
 class EventModel(SQLModel, table=True):
     __tablename__ = "events"
+    __table_args__ = (
+        # Полнотекстовый поиск по названию (русская морфология)
+        Index(
+            "ix_events_summary_tsv",
+            text("to_tsvector('russian', summary)"),
+            postgresql_using="gin",
+        ),
+    )
 
     # Внутренний ID (Primary Key)
     event_id: Optional[int] = Field(
@@ -29,7 +37,7 @@ class EventModel(SQLModel, table=True):
     google_event_id: str = Field(unique=True, index=True)
 
     status: EventStatus = Field(default=EventStatus.NEW, index=True)
-    summary: str = Field(index=True)
+    summary: str
 
     # Флаг "Весь день"
     is_all_day: bool = Field(default=False)
@@ -65,4 +73,10 @@ class EventRead(SQLModel):
     link: Optional[str] = None
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
-    updated_at: datetime
\ No newline at end of file
+    updated_at: datetime
+
+
+class EventSearchPage(SQLModel):
+    items: List[EventRead]
+    # Курсор следующей страницы, None — страниц больше нет
+    next_cursor: Optional[str] = None
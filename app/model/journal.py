@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import Column, DateTime, BigInteger, Identity, ForeignKey, SmallInteger, CheckConstraint, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+from app.model.event import EventStatus
+
+
+class EventChangeModel(SQLModel, table=True):
+    """Журнал изменений событий (только добавление). change_id служит курсором для потребителей."""
+    __tablename__ = "event_changes"
+
+    change_id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(BigInteger, Identity(always=True), primary_key=True)
+    )
+
+    event_id: int = Field(
+        sa_column=Column(BigInteger, ForeignKey("events.event_id", ondelete="CASCADE"), nullable=False, index=True)
+    )
+    google_event_id: str
+
+    # None — событие создано
+    old_status: Optional[EventStatus] = Field(default=None)
+    new_status: EventStatus
+
+    changed_fields: List[str] = Field(default_factory=list, sa_column=Column(JSONB, nullable=False))
+
+    changed_at: datetime = Field(
+        sa_column=Column(
+            DateTime(timezone=True),
+            server_default=func.now(),
+            nullable=False,
+            index=True,
+        )
+    )
+
+
+class EventChangesWatermarkModel(SQLModel, table=True):
+    """Одна строка: наибольший change_id, удаленный очисткой журнала.
+    Курсор ниже этой отметки означает, что часть записей потребитель уже не получит."""
+    __tablename__ = "event_changes_watermark"
+    __table_args__ = (CheckConstraint("id = 1", name="ck_event_changes_watermark_single_row"),)
+
+    id: int = Field(default=1, sa_column=Column(SmallInteger, primary_key=True))
+    pruned_up_to: int = Field(sa_column=Column(BigInteger, nullable=False))
+
+
+# Схемы для ответа API
+class EventChangeRead(SQLModel):
+    change_id: int
+    event_id: int
+    google_event_id: str
+    old_status: Optional[EventStatus] = None
+    new_status: EventStatus
+    changed_fields: List[str]
+    changed_at: datetime
+
+
+class EventChangePage(SQLModel):
+    items: List[EventChangeRead]
+    # Передается в следующий запрос как since
+    next_cursor: int
+    has_more: bool
@@ -0,0 +1,35 @@
+from datetime import date
+from typing import Dict, List
+
+from sqlalchemy import Column, Date, Integer
+from sqlmodel import Field, SQLModel
+
+from app.model.event import EventStatus
+
+
+class EventDayCountModel(SQLModel, table=True):
+    """Агрегат: количество событий на день в разрезе статусов. Многодневное событие учитывается
+    в каждом дне своего интервала; день — локальная дата в settings.TIMEZONE, для событий
+    "весь день" — дата по UTC (как группировка во фронте).
+    Поддерживается инкрементально в тех же транзакциях, что синхронизация и подтверждение."""
+    __tablename__ = "event_day_counts"
+
+    day: date = Field(sa_column=Column(Date, primary_key=True))
+    status: EventStatus = Field(primary_key=True)
+    count: int = Field(sa_column=Column(Integer, nullable=False, default=0))
+
+
+# Схемы для ответа API
+class EventDaySummary(SQLModel):
+    day: date
+    counts: Dict[EventStatus, int]
+
+
+class EventMonthSummary(SQLModel):
+    year: int
+    month: int
+    days: List[EventDaySummary]
+    # Уникальные события, пересекающие месяц (многодневное считается один раз)
+    totals: Dict[EventStatus, int]
+    # NEW + CHANGED за всё время (бейджи режима "к обработке")
+    pending: Dict[EventStatus, int]
@@ -1,17 +1,28 @@
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
 from app.core import check_api_key, get_session
-from app.service import list_events, confirm_event_action
-from app.model import EventRead, EventStatus
+from app.service import (
+    sync_events,
+    list_events,
+    confirm_event_action,
+    get_month_summary,
+    search_events,
+    list_changes,
+    ChangesCursorExpiredError,
+)
+from app.model import EventRead, EventStatus, EventMonthSummary, EventSearchPage, EventChangePage
 
 router = APIRouter(prefix="/events", tags=["Events"], dependencies=[Depends(check_api_key)])
 
+STALE_HEADER = "X-Data-Stale"
+
 
 @router.get("/", response_model=List[EventRead])
 async def get_events_route(
+        response: Response,
         status: Optional[EventStatus] = None,
         show_archive: bool = False,
         year: Optional[int] = None,
@@ -31,6 +42,10 @@ async def get_events_route(
         # Если is_todo_mode == True, то year/month останутся None,
         # и сервис вернет все записи без фильтрации по дате.
 
+        # Если Google недоступен — отдаем данные из БД и помечаем их устаревшими
+        if not await sync_events(session):
+            response.headers[STALE_HEADER] = "true"
+
         return await list_events(session, status, show_archive, year, month)
 
     except Exception as e:
@@ -39,6 +54,59 @@ async def get_events_route(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/summary", response_model=EventMonthSummary)
+async def get_events_summary_route(
+        year: Optional[int] = Query(default=None, ge=1, le=9998),
+        month: Optional[int] = Query(default=None, ge=1, le=12),
+        session: AsyncSession = Depends(get_session)
+):
+    # Сводка читается из агрегата event_day_counts без синхронизации с Google,
+    # агрегат обновляется при каждом GET /events/ и подтверждении
+    if year is None or month is None:
+        now = datetime.now()
+        year = now.year
+        month = now.month
+
+    return await get_month_summary(session, year, month)
+
+
+@router.get("/search", response_model=EventSearchPage)
+async def search_events_route(
+        q: str = Query(min_length=1, max_length=200),
+        status: Optional[EventStatus] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: int = Query(default=20, ge=1, le=100),
+        cursor: Optional[str] = None,
+        session: AsyncSession = Depends(get_session)
+):
+    try:
+        return await search_events(session, q, status, date_from, date_to, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/changes", response_model=EventChangePage)
+async def get_event_changes_route(
+        since: int = Query(default=0, ge=0),
+        limit: Optional[int] = Query(default=None, ge=1, le=1000),
+        session: AsyncSession = Depends(get_session)
+):
+    # Журнал читается без синхронизации с Google: он пополняется при GET /events/ и подтверждении
+    try:
+        return await list_changes(session, since, limit)
+    except ChangesCursorExpiredError as e:
+        raise HTTPException(
+            status_code=410,
+            detail={
+                "error": "Cursor Expired",
+                "message": str(e),
+                "remedy": "Re-read the full state via GET /events/ and continue with since=<cursor>.",
+                "cursor": e.watermark,
+            },
+        )
+
+
 @router.post("/{event_id}/confirm", response_model=EventRead)
 async def confirm_event_route(
         event_id: int,
@@ -1,8 +1,18 @@
-from .calendar import fetch_upcoming_events, list_events, confirm_event_action
+from .calendar import fetch_upcoming_events, sync_events, list_events, confirm_event_action, warm_up_calendar
+from .summary import get_month_summary
+from .search import search_events
+from .journal import list_changes, prune_changes_periodically, ChangesCursorExpiredError
 
 
 __all__ = [
     "fetch_upcoming_events",
+    "sync_events",
     "list_events",
-    "confirm_event_action"
-]
\ No newline at end of file
+    "confirm_event_action",
+    "warm_up_calendar",
+    "get_month_summary",
+    "search_events",
+    "list_changes",
+    "prune_changes_periodically",
+    "ChangesCursorExpiredError"
+]
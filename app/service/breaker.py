@@ -0,0 +1,74 @@
+import time
+from enum import Enum
+from typing import Optional
+
+from app.core import settings, logger
+
+
+class GoogleUnavailableError(Exception):
+    """Google недоступен: ошибка, таймаут или открытый предохранитель."""
+
+
+class BreakerState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Простой предохранитель. Состояние хранится в процессе (у каждого воркера своё).
+    После failure_threshold ошибок подряд вызовы блокируются на recovery_timeout секунд,
+    затем пропускается одна пробная попытка (half-open)."""
+
+    def __init__(self, name: str, failure_threshold: int, recovery_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_in_flight = False
+
+    def allow(self) -> bool:
+        if self.state == BreakerState.CLOSED:
+            return True
+
+        if self.state == BreakerState.OPEN:
+            if time.monotonic() - self.opened_at < self.recovery_timeout:
+                return False
+            self.state = BreakerState.HALF_OPEN
+            logger.info(f"Предохранитель {self.name}: пробный запрос")
+
+        # HALF_OPEN: пропускаем только один пробный запрос
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        if self.state != BreakerState.CLOSED:
+            logger.info(f"Предохранитель {self.name}: закрыт")
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Запрос отменён без результата — разрешаем следующую пробу."""
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.state == BreakerState.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != BreakerState.OPEN:
+                logger.warning(f"Предохранитель {self.name}: открыт на {self.recovery_timeout} с")
+            self.state = BreakerState.OPEN
+            self.opened_at = time.monotonic()
+
+
+google_breaker = CircuitBreaker(
+    "google",
+    failure_threshold=settings.GOOGLE_BREAKER_FAILURE_THRESHOLD,
+    recovery_timeout=settings.GOOGLE_BREAKER_RECOVERY_TIMEOUT,
+)
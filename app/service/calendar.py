@@ -1,34 +1,81 @@
 import datetime
 import asyncio
+import threading
 from calendar import monthrange
+from functools import lru_cache
 from typing import List, Dict, Optional, Sequence
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy import func, select, or_
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-
 from app.core import settings, logger
 from app.model.event import EventModel, EventStatus
+from app.service.summary import event_days, refresh_day_counts
+from app.service.breaker import google_breaker, GoogleUnavailableError
+from app.service.journal import change_entry, record_changes
 
 
-def get_calendar_service():
+# Поля, которые приходят из Google и попадают в журнал изменений
+SYNCED_FIELDS = ["summary", "start_time", "end_time", "link", "is_all_day"]
+
+
+# Учетные данные загружаются один раз и обновляются на месте; доступ из потоков executor'а
+_creds_lock = threading.Lock()
+_creds = None
+
+
+def _get_credentials():
     """Авторизация"""
-    creds = None
-    if settings.TOKEN_FILE.exists():
-        creds = Credentials.from_authorized_user_file(settings.TOKEN_FILE, settings.SCOPES)
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            try:
-                creds.refresh(Request())
-                with settings.TOKEN_FILE.open('w') as token:
-                    token.write(creds.to_json())
-            except Exception:
-                pass
-    return build('calendar', 'v3', credentials=creds)
+    global _creds
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+
+    with _creds_lock:
+        if _creds is None and settings.TOKEN_FILE.exists():
+            _creds = Credentials.from_authorized_user_file(settings.TOKEN_FILE, settings.SCOPES)
+        if _creds is None:
+            raise RuntimeError(f"Не найден токен {settings.TOKEN_FILE}")
+        if not _creds.valid and _creds.expired and _creds.refresh_token:
+            # Ошибку обновления токена не глотаем — её учитывает предохранитель
+            _creds.refresh(Request())
+            with settings.TOKEN_FILE.open('w') as token:
+                token.write(_creds.to_json())
+        return _creds
+
+
+def _new_http():
+    import httplib2
+    from google_auth_httplib2 import AuthorizedHttp
+    # Таймаут сокета, чтобы зависший запрос не занимал поток executor'а бесконечно
+    return AuthorizedHttp(_get_credentials(), http=httplib2.Http(timeout=settings.GOOGLE_SYNC_TIMEOUT))
+
+
+@lru_cache
+def _build_calendar_service():
+    """Клиент строится один раз на процесс. httplib2.Http не потокобезопасен, поэтому
+    каждый запрос получает свой Http через requestBuilder."""
+    import json
+    from googleapiclient.discovery import build_from_document
+    from googleapiclient.discovery_cache import get_static_doc
+    from googleapiclient.http import HttpRequest
+
+    def _build_request(_http, *args, **kwargs):
+        return HttpRequest(_new_http(), *args, **kwargs)
+
+    discovery_doc = json.loads(get_static_doc('calendar', 'v3'))
+    return build_from_document(discovery_doc, http=_new_http(), requestBuilder=_build_request)
+
+
+def get_calendar_service():
+    # Тяжелый стек google-auth/googleapiclient импортируется лениво, не при старте воркера
+    _get_credentials()  # обновляет токен заранее, если он истек
+    return _build_calendar_service()
+
+
+def warm_up_calendar() -> None:
+    """Прогрев: импорт клиента, сборка сервиса и проверка токена."""
+    get_calendar_service()
 
 
 def _get_time_str(time_obj: dict) -> str | None:
@@ -51,10 +98,48 @@ def _parse_to_datetime(time_str: str | None) -> datetime.datetime | None:
             return None
 
 
-async def fetch_upcoming_events(session: AsyncSession, max_results=250):
+async def _fetch_google_events(now_utc: datetime.datetime, max_results: int) -> List[dict]:
+    """Все будущие события из Google. Защищено предохранителем и дедлайном GOOGLE_SYNC_TIMEOUT."""
+    if not google_breaker.allow():
+        raise GoogleUnavailableError("Предохранитель Google открыт")
+
+    def _fetch_all_pages() -> List[dict]:
+        service = get_calendar_service()
+        all_items = []
+        page_token = None
+        while True:
+            result = service.events().list(
+                calendarId=settings.CALENDAR_ID,
+                timeMin=now_utc.isoformat(),
+                maxResults=max_results,
+                singleEvents=True,
+                orderBy='startTime',
+                pageToken=page_token
+            ).execute()
+            items = result.get('items', [])
+            all_items.extend(items)
+            page_token = result.get('nextPageToken')
+            if not page_token: break
+        return all_items
+
     loop = asyncio.get_running_loop()
-    service = await loop.run_in_executor(None, get_calendar_service)
+    try:
+        items = await asyncio.wait_for(
+            loop.run_in_executor(None, _fetch_all_pages),
+            timeout=settings.GOOGLE_SYNC_TIMEOUT,
+        )
+    except asyncio.CancelledError:
+        google_breaker.release_probe()
+        raise
+    except Exception as e:
+        google_breaker.record_failure()
+        raise GoogleUnavailableError(f"Ошибка запроса к Google: {e!r}") from e
 
+    google_breaker.record_success()
+    return items
+
+
+async def fetch_upcoming_events(session: AsyncSession, max_results=250):
     now_utc = datetime.datetime.now(datetime.timezone.utc)
 
     # 1. АРХИВАЦИЯ
@@ -64,40 +149,31 @@ async def fetch_upcoming_events(session: AsyncSession, max_results=250):
     )
     archive_result = await session.execute(archive_stmt)
     events_to_archive = archive_result.scalars().all()
+    archived_days = set()
+    archive_changes = []
 
     for event in events_to_archive:
+        archived_days.update(event_days(event.start_time, event.end_time, event.is_all_day))
+        old_status = event.status
         if event.status in [EventStatus.NEW, EventStatus.CHANGED]:
             event.status = EventStatus.MISSED
         else:
             event.status = EventStatus.COMPLETED
         session.add(event)
+        archive_changes.append(
+            change_entry(event.event_id, event.google_event_id, old_status, event.status, ["status"])
+        )
 
     if events_to_archive:
+        await refresh_day_counts(session, archived_days)
+        await record_changes(session, archive_changes)
         await session.commit()
         logger.info(f"В архив: {len(events_to_archive)}")
 
     # 2. ПОЛУЧЕНИЕ ИЗ GOOGLE
     logger.info(f"Синхронизация: {settings.CALENDAR_ID}")
 
-    def _fetch_all_pages() -> List[dict]:
-        all_items = []
-        page_token = None
-        while True:
-            result = service.events().list(
-                calendarId=settings.CALENDAR_ID,
-                timeMin=now_utc.isoformat(),
-                maxResults=max_results,
-                singleEvents=True,
-                orderBy='startTime',
-                pageToken=page_token
-            ).execute()
-            items = result.get('items', [])
-            all_items.extend(items)
-            page_token = result.get('nextPageToken')
-            if not page_token: break
-        return all_items
-
-    google_events = await loop.run_in_executor(None, _fetch_all_pages)
+    google_events = await _fetch_google_events(now_utc, max_results)
     google_ids = {ge['id'] for ge in google_events}
 
     # 3. СВЕРКА С БД
@@ -111,6 +187,11 @@ async def fetch_upcoming_events(session: AsyncSession, max_results=250):
     db_events_map: Dict[str, EventModel] = {e.google_event_id: e for e in result.scalars().all()}
 
     clean_events_data = []
+    # Дни, агрегат по которым нужно пересчитать (старые и новые даты событий)
+    touched_days = set()
+    # Записи журнала изменений и новые события (их event_id известен только после upsert)
+    changes = []
+    new_google_ids = []
 
     # 4. ОБРАБОТКА
     for ge in google_events:
@@ -135,6 +216,7 @@ async def fetch_upcoming_events(session: AsyncSession, max_results=250):
         # Логика смены статуса при обновлении
         if g_id in db_events_map:
             event = db_events_map[g_id]
+            old_status = event.status
 
             # Восстанавливаем из отмененных
             if event.status in [EventStatus.CANCELLED, EventStatus.MISSED]:
@@ -154,7 +236,32 @@ async def fetch_upcoming_events(session: AsyncSession, max_results=250):
                 event.status = EventStatus.CHANGED
                 session.add(event)
 
+            # Пересчитываем все дни старого и нового интервала события
+            if (
+                    event.status != old_status or
+                    event.start_time != event_dict['start_time'] or
+                    event.end_time != event_dict['end_time'] or
+                    event.is_all_day != event_dict['is_all_day']
+            ):
+                touched_days.update(event_days(event.start_time, event.end_time, event.is_all_day))
+                touched_days.update(
+                    event_days(event_dict['start_time'], event_dict['end_time'], event_dict['is_all_day'])
+                )
+
+            changed_fields = [f for f in SYNCED_FIELDS if getattr(event, f) != event_dict[f]]
+            if event.status != old_status:
+                changed_fields.append("status")
+            if changed_fields:
+                changes.append(
+                    change_entry(event.event_id, g_id, old_status, event.status, changed_fields)
+                )
+
             db_events_map.pop(g_id)  # Убираем из мапы (останутся только удаленные)
+        else:
+            touched_days.update(
+                event_days(event_dict['start_time'], event_dict['end_time'], event_dict['is_all_day'])
+            )
+            new_google_ids.append(g_id)
 
     # 5. UPSERT (Массовая вставка/обновление данных)
     if clean_events_data:
@@ -170,20 +277,45 @@ async def fetch_upcoming_events(session: AsyncSession, max_results=250):
                 "updated_at": func.now()
             }
         )
-        await session.execute(stmt)
+        stmt = stmt.returning(EventModel.event_id, EventModel.google_event_id)
+        upsert_result = await session.execute(stmt)
+        ids_map = {g_id: e_id for e_id, g_id in upsert_result.all()}
+
+        for g_id in new_google_ids:
+            changes.append(
+                change_entry(ids_map[g_id], g_id, None, EventStatus.NEW, SYNCED_FIELDS + ["status"])
+            )
 
     # 6. УДАЛЕНИЕ (те, что остались в мапе)
     for event in db_events_map.values():
         if event.status not in [EventStatus.CANCELLED, EventStatus.COMPLETED, EventStatus.MISSED]:
+            changes.append(
+                change_entry(event.event_id, event.google_event_id, event.status, EventStatus.CANCELLED, ["status"])
+            )
             event.status = EventStatus.CANCELLED
             session.add(event)
+            touched_days.update(event_days(event.start_time, event.end_time, event.is_all_day))
 
+    await refresh_day_counts(session, touched_days)
+    await record_changes(session, changes)
     await session.commit()
     logger.info(f"Обработано {len(clean_events_data)} событий.")
 
 
 # --- PUBLIC METHODS ---
 
+async def sync_events(session: AsyncSession) -> bool:
+    """Синхронизация без падения чтения: при недоступности Google возвращает False,
+    и данные отдаются из БД как устаревшие."""
+    try:
+        await fetch_upcoming_events(session)
+        return True
+    except GoogleUnavailableError as e:
+        logger.warning(f"Синхронизация пропущена, данные из БД: {e}")
+        await session.rollback()
+        return False
+
+
 async def list_events(
         session: AsyncSession,
         status: Optional[EventStatus] = None,
@@ -191,7 +323,6 @@ async def list_events(
         year: Optional[int] = None,
         month: Optional[int] = None
 ) -> Sequence[EventModel]:
-    await fetch_upcoming_events(session)
     query = select(EventModel)
 
     # Фильтр по дате
@@ -231,8 +362,14 @@ async def confirm_event_action(session: AsyncSession, event_id: int) -> Optional
     event = result.scalar_one_or_none()
 
     if event:
+        old_status = event.status
         event.status = EventStatus.CONFIRMED
         session.add(event)
+        await refresh_day_counts(session, event_days(event.start_time, event.end_time, event.is_all_day))
+        if old_status != EventStatus.CONFIRMED:
+            await record_changes(session, [
+                change_entry(event.event_id, event.google_event_id, old_status, event.status, ["status"])
+            ])
         await session.commit()
         await session.refresh(event)
 
@@ -0,0 +1,124 @@
+import asyncio
+import datetime
+from typing import List, Optional
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import settings, logger
+from app.core.database import async_session_maker
+from app.model.event import EventStatus
+from app.model.journal import EventChangeModel, EventChangesWatermarkModel, EventChangeRead, EventChangePage
+
+
+# Ключ pg_advisory_xact_lock(namespace, key) для писателей журнала
+_JOURNAL_LOCK = (30, 0)
+
+
+class ChangesCursorExpiredError(Exception):
+    """Записи после курсора уже удалены по сроку хранения — потребителю нужно полное перечитывание."""
+
+    def __init__(self, since: int, watermark: int):
+        super().__init__(f"Курсор {since} устарел: записи до {watermark} включительно удалены")
+        self.since = since
+        self.watermark = watermark
+
+
+async def _lock_journal(session: AsyncSession) -> None:
+    """Писатели журнала работают по одному до конца транзакции. change_id выдается при вставке,
+    а видимой строка становится при коммите; без блокировки T1 (id 10) может закоммититься после
+    T2 (id 11), и читатель с курсором 11 никогда не увидит 10. Под блокировкой порядок id
+    совпадает с порядком коммитов. Берется после блокировок дней в refresh_day_counts."""
+    await session.execute(select(func.pg_advisory_xact_lock(*_JOURNAL_LOCK)))
+
+
+def change_entry(
+        event_id: int,
+        google_event_id: str,
+        old_status: Optional[EventStatus],
+        new_status: EventStatus,
+        changed_fields: List[str],
+) -> dict:
+    return {
+        "event_id": event_id,
+        "google_event_id": google_event_id,
+        "old_status": old_status,
+        "new_status": new_status,
+        "changed_fields": changed_fields,
+    }
+
+
+async def record_changes(session: AsyncSession, entries: List[dict]) -> None:
+    """Пишет записи журнала. Коммит — на стороне вызывающего (та же транзакция, что и изменение)."""
+    if not entries:
+        return
+    await _lock_journal(session)
+    await session.execute(insert(EventChangeModel), entries)
+
+
+async def list_changes(session: AsyncSession, since: int = 0, limit: Optional[int] = None) -> EventChangePage:
+    limit = limit or settings.CHANGES_PAGE_LIMIT
+
+    watermark = (await session.execute(select(EventChangesWatermarkModel.pruned_up_to))).scalar()
+    if watermark is not None and since < watermark:
+        raise ChangesCursorExpiredError(since, watermark)
+
+    query = (
+        select(EventChangeModel)
+        .where(EventChangeModel.change_id > since)
+        .order_by(EventChangeModel.change_id.asc())
+        .limit(limit + 1)
+    )
+    result = await session.execute(query)
+    rows = result.scalars().all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    return EventChangePage(
+        items=[EventChangeRead.model_validate(row) for row in rows],
+        next_cursor=rows[-1].change_id if rows else since,
+        has_more=has_more,
+    )
+
+
+async def prune_changes(session: AsyncSession, retention_days: Optional[int] = None) -> int:
+    if retention_days is None:
+        retention_days = settings.CHANGES_RETENTION_DAYS
+    border = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=retention_days)
+
+    # Удаляем префикс по change_id, чтобы отметка точно означала "всё до неё удалено"
+    await _lock_journal(session)
+    max_id = (await session.execute(
+        select(func.max(EventChangeModel.change_id)).where(EventChangeModel.changed_at < border)
+    )).scalar()
+    if max_id is None:
+        await session.commit()
+        return 0
+
+    result = await session.execute(delete(EventChangeModel).where(EventChangeModel.change_id <= max_id))
+
+    stmt = pg_insert(EventChangesWatermarkModel).values(id=1, pruned_up_to=max_id)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["id"],
+        set_={"pruned_up_to": func.greatest(EventChangesWatermarkModel.pruned_up_to, stmt.excluded.pruned_up_to)},
+    )
+    await session.execute(stmt)
+
+    await session.commit()
+    return result.rowcount
+
+
+async def prune_changes_periodically() -> None:
+    """Фоновая задача очистки журнала. Запускается в lifespan каждого воркера;
+    удаление идемпотентно, поэтому параллельный запуск в нескольких воркерах безопасен."""
+    while True:
+        try:
+            async with async_session_maker() as session:
+                deleted = await prune_changes(session)
+            if deleted:
+                logger.info(f"Журнал изменений: удалено {deleted} записей")
+        except Exception as e:
+            logger.warning(f"Очистка журнала изменений не удалась: {e!r}")
+        await asyncio.sleep(settings.CHANGES_PRUNE_INTERVAL)
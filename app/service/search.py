@@ -0,0 +1,83 @@
+import base64
+import datetime
+import json
+import re
+from typing import Optional
+
+from sqlalchemy import func, select, literal_column, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.model.event import EventModel, EventRead, EventStatus, EventSearchPage
+
+
+# Выражение должно совпадать с ix_events_summary_tsv, иначе индекс не используется
+_SEARCH_CONFIG = literal_column("'russian'")
+_search_vector = func.to_tsvector(_SEARCH_CONFIG, EventModel.summary)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def build_ts_query(q: str) -> Optional[str]:
+    """Строка запроса пользователя -> to_tsquery: все слова через AND, последнее — по префиксу."""
+    tokens = _TOKEN_RE.findall(q.lower())
+    if not tokens:
+        return None
+    tokens[-1] = f"{tokens[-1]}:*"
+    return " & ".join(tokens)
+
+
+def _encode_cursor(rank: float, event_id: int) -> str:
+    raw = json.dumps({"r": rank, "id": event_id}).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[float, int]:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return float(data["r"]), int(data["id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Некорректный курсор") from e
+
+
+async def search_events(
+        session: AsyncSession,
+        q: str,
+        status: Optional[EventStatus] = None,
+        date_from: Optional[datetime.datetime] = None,
+        date_to: Optional[datetime.datetime] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+) -> EventSearchPage:
+    ts_query_str = build_ts_query(q)
+    if ts_query_str is None:
+        raise ValueError("Пустой поисковый запрос")
+
+    ts_query = func.to_tsquery(_SEARCH_CONFIG, ts_query_str)
+    rank = func.ts_rank(_search_vector, ts_query).label("rank")
+
+    query = select(EventModel, rank).where(_search_vector.op("@@")(ts_query))
+
+    if status:
+        query = query.where(EventModel.status == status)
+    if date_from:
+        query = query.where(EventModel.start_time >= date_from)
+    if date_to:
+        query = query.where(EventModel.start_time < date_to)
+
+    # Keyset-пагинация по (rank, event_id) — без OFFSET
+    if cursor:
+        cursor_rank, cursor_id = _decode_cursor(cursor)
+        query = query.where(tuple_(rank, EventModel.event_id) < tuple_(cursor_rank, cursor_id))
+
+    query = query.order_by(rank.desc(), EventModel.event_id.desc()).limit(limit + 1)
+
+    result = await session.execute(query)
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_event, last_rank = rows[-1]
+        next_cursor = _encode_cursor(last_rank, last_event.event_id)
+
+    return EventSearchPage(items=[EventRead.model_validate(event) for event, _ in rows], next_cursor=next_cursor)
@@ -0,0 +1,163 @@
+import datetime
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import func, select, delete, and_, or_, not_, tuple_, case, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import settings
+from app.model.event import EventModel, EventStatus
+from app.model.summary import EventDayCountModel, EventDaySummary, EventMonthSummary
+
+
+PENDING_STATUSES = [EventStatus.NEW, EventStatus.CHANGED]
+
+# Ключ namespace для pg_advisory_xact_lock(namespace, день)
+_DAY_LOCK_NAMESPACE = 26
+
+# Дни события — как при группировке во фронте (index.html, renderTimeline): событие попадает
+# в каждый день от начала до конца. "Весь день" — по UTC, end_time не включается;
+# остальные — по локальной дате в settings.TIMEZONE, конец ровно в полночь не включается.
+# SQL-выражения ниже (и бэкфилл в миграции) повторяют event_days.
+_ONE_DAY = datetime.timedelta(days=1)
+
+_first_day_expr = func.date(
+    case(
+        (EventModel.is_all_day, func.timezone("UTC", EventModel.start_time)),
+        else_=func.timezone(settings.TIMEZONE, EventModel.start_time),
+    )
+)
+_last_day_expr = func.greatest(
+    _first_day_expr,
+    case(
+        (EventModel.end_time.is_(None), _first_day_expr),
+        (EventModel.is_all_day, func.date(func.timezone("UTC", EventModel.end_time)) - literal_column("1")),
+        else_=func.date(
+            func.timezone(settings.TIMEZONE, EventModel.end_time) - literal_column("interval '1 microsecond'")
+        ),
+    ),
+)
+
+
+def event_days(
+        start_time: Optional[datetime.datetime],
+        end_time: Optional[datetime.datetime],
+        is_all_day: bool,
+) -> List[datetime.date]:
+    if start_time is None: return []
+    tz = datetime.timezone.utc if is_all_day else ZoneInfo(settings.TIMEZONE)
+    first = start_time.astimezone(tz).date()
+
+    if end_time is None:
+        last = first
+    elif is_all_day:
+        last = end_time.astimezone(tz).date() - _ONE_DAY
+    else:
+        last = (end_time.astimezone(tz) - datetime.timedelta(microseconds=1)).date()
+
+    return [first + _ONE_DAY * i for i in range((max(last, first) - first).days + 1)]
+
+
+async def refresh_day_counts(session: AsyncSession, days: Iterable[Optional[datetime.date]]) -> None:
+    """Пересчитывает агрегат только для затронутых дней. Коммит — на стороне вызывающего,
+    чтобы агрегат менялся в той же транзакции, что и сами события."""
+    days: Set[datetime.date] = {d for d in days if d is not None}
+    if not days:
+        return
+
+    # Пересчет из своего снимка + запись абсолютных значений теряет обновления при
+    # параллельных транзакциях, поэтому дни блокируются до подсчета (в порядке дат — без дедлоков).
+    # В READ COMMITTED подсчет после блокировки видит изменения уже закоммиченных соседей.
+    for day in sorted(days):
+        await session.execute(select(func.pg_advisory_xact_lock(_DAY_LOCK_NAMESPACE, day.toordinal())))
+
+    # События, пересекающие затронутые дни (с запасом в день на смещение пояса)
+    range_start = datetime.datetime.combine(min(days) - _ONE_DAY, datetime.time.min, tzinfo=datetime.timezone.utc)
+    range_end = datetime.datetime.combine(max(days) + 2 * _ONE_DAY, datetime.time.min, tzinfo=datetime.timezone.utc)
+
+    events_stmt = select(
+        EventModel.start_time, EventModel.end_time, EventModel.is_all_day, EventModel.status
+    ).where(
+        EventModel.start_time < range_end,
+        or_(
+            EventModel.end_time >= range_start,
+            and_(EventModel.end_time.is_(None), EventModel.start_time >= range_start),
+        ),
+    )
+    result = await session.execute(events_stmt)
+
+    counts: Counter = Counter()
+    for start_time, end_time, is_all_day, status in result.all():
+        for day in event_days(start_time, end_time, is_all_day):
+            if day in days:
+                counts[(day, status)] += 1
+
+    rows = [{"day": day, "status": status, "count": count} for (day, status), count in counts.items()]
+
+    if rows:
+        stmt = pg_insert(EventDayCountModel).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["day", "status"],
+            set_={"count": stmt.excluded.count},
+        )
+        await session.execute(stmt)
+
+    # Удаляем пары (день, статус), для которых событий больше нет
+    stale_stmt = delete(EventDayCountModel).where(EventDayCountModel.day.in_(days))
+    if rows:
+        stale_stmt = stale_stmt.where(
+            not_(tuple_(EventDayCountModel.day, EventDayCountModel.status).in_(
+                [(r["day"], r["status"]) for r in rows]
+            ))
+        )
+    await session.execute(stale_stmt)
+
+
+async def get_month_summary(session: AsyncSession, year: int, month: int) -> EventMonthSummary:
+    dt_start = datetime.date(year, month, 1)
+    dt_end = datetime.date(year + 1, 1, 1) if month == 12 else datetime.date(year, month + 1, 1)
+
+    query = (
+        select(EventDayCountModel)
+        .where(and_(EventDayCountModel.day >= dt_start, EventDayCountModel.day < dt_end))
+        .order_by(EventDayCountModel.day.asc())
+    )
+    result = await session.execute(query)
+
+    days: Dict[datetime.date, Dict[EventStatus, int]] = {}
+    for row in result.scalars().all():
+        days.setdefault(row.day, {})[row.status] = row.count
+
+    # Итоги — по уникальным событиям: сумма по дням посчитала бы многодневные несколько раз
+    range_start = datetime.datetime.combine(dt_start - _ONE_DAY, datetime.time.min, tzinfo=datetime.timezone.utc)
+    range_end = datetime.datetime.combine(dt_end + _ONE_DAY, datetime.time.min, tzinfo=datetime.timezone.utc)
+    totals_query = (
+        select(EventModel.status, func.count())
+        .where(
+            EventModel.start_time < range_end,
+            or_(EventModel.end_time >= range_start, EventModel.end_time.is_(None)),
+            _first_day_expr < dt_end,
+            _last_day_expr >= dt_start,
+        )
+        .group_by(EventModel.status)
+    )
+    totals_result = await session.execute(totals_query)
+    totals = {status: count for status, count in totals_result.all()}
+
+    pending_query = (
+        select(EventModel.status, func.count())
+        .where(EventModel.status.in_(PENDING_STATUSES))
+        .group_by(EventModel.status)
+    )
+    pending_result = await session.execute(pending_query)
+    pending = {status: count for status, count in pending_result.all()}
+
+    return EventMonthSummary(
+        year=year,
+        month=month,
+        days=[EventDaySummary(day=day, counts=counts) for day, counts in days.items()],
+        totals=totals,
+        pending=pending,
+    )
@@ -0,0 +1,72 @@
+"""event day counts
+
+Revision ID: 8f3b2c1d9e47
+Revises: 434d5a9445cb
+Create Date: 2026-10-19 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+# import app
+from app.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3b2c1d9e47'
+down_revision: Union[str, Sequence[str], None] = '434d5a9445cb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('event_day_counts',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', postgresql.ENUM('NEW', 'CONFIRMED', 'CHANGED', 'CANCELLED', 'COMPLETED', 'MISSED', name='eventstatus', create_type=False), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'status')
+    )
+
+    # Первичное заполнение агрегата по уже существующим событиям.
+    # Дни считаются так же, как app.service.summary.event_days: событие попадает в каждый день
+    # интервала; "весь день" — по UTC без дня окончания, остальные — по TIMEZONE,
+    # конец ровно в полночь не включается
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO event_day_counts (day, status, count)
+            SELECT d::date, e.status, count(*)
+            FROM (
+                SELECT
+                    status,
+                    first_day,
+                    greatest(first_day, CASE
+                        WHEN end_time IS NULL THEN first_day
+                        WHEN is_all_day THEN date(timezone('UTC', end_time)) - 1
+                        ELSE date(timezone(:tz, end_time) - interval '1 microsecond')
+                    END) AS last_day
+                FROM (
+                    SELECT
+                        status,
+                        end_time,
+                        is_all_day,
+                        date(CASE WHEN is_all_day THEN timezone('UTC', start_time)
+                                  ELSE timezone(:tz, start_time) END) AS first_day
+                    FROM events
+                    WHERE start_time IS NOT NULL
+                ) AS event_starts
+            ) AS e
+            CROSS JOIN LATERAL generate_series(e.first_day, e.last_day, interval '1 day') AS d
+            GROUP BY d::date, e.status
+            """
+        ).bindparams(tz=settings.TIMEZONE)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('event_day_counts')
@@ -0,0 +1,39 @@
+"""events summary fulltext
+
+Revision ID: c41e7a90b2d5
+Revises: 8f3b2c1d9e47
+Create Date: 2026-10-19 11:02:17.904512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+# import app
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e7a90b2d5'
+down_revision: Union[str, Sequence[str], None] = '8f3b2c1d9e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # B-tree по summary не использовался ни одним запросом
+    op.drop_index(op.f('ix_events_summary'), table_name='events')
+    op.create_index(
+        'ix_events_summary_tsv',
+        'events',
+        [sa.text("to_tsvector('russian', summary)")],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_events_summary_tsv', table_name='events')
+    op.create_index(op.f('ix_events_summary'), 'events', ['summary'], unique=False)
@@ -0,0 +1,52 @@
+"""event changes
+
+Revision ID: e5a9d3f61c08
+Revises: c41e7a90b2d5
+Create Date: 2026-10-19 13:47:05.226931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+# import app
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a9d3f61c08'
+down_revision: Union[str, Sequence[str], None] = 'c41e7a90b2d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('event_changes',
+    sa.Column('change_id', sa.BigInteger(), sa.Identity(always=True), nullable=False),
+    sa.Column('event_id', sa.BigInteger(), nullable=False),
+    sa.Column('google_event_id', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('old_status', postgresql.ENUM('NEW', 'CONFIRMED', 'CHANGED', 'CANCELLED', 'COMPLETED', 'MISSED', name='eventstatus', create_type=False), nullable=True),
+    sa.Column('new_status', postgresql.ENUM('NEW', 'CONFIRMED', 'CHANGED', 'CANCELLED', 'COMPLETED', 'MISSED', name='eventstatus', create_type=False), nullable=False),
+    sa.Column('changed_fields', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['event_id'], ['events.event_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('change_id')
+    )
+    op.create_index(op.f('ix_event_changes_event_id'), 'event_changes', ['event_id'], unique=False)
+    op.create_index(op.f('ix_event_changes_changed_at'), 'event_changes', ['changed_at'], unique=False)
+    op.create_table('event_changes_watermark',
+    sa.Column('id', sa.SmallInteger(), nullable=False),
+    sa.Column('pruned_up_to', sa.BigInteger(), nullable=False),
+    sa.CheckConstraint('id = 1', name='ck_event_changes_watermark_single_row'),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('event_changes_watermark')
+    op.drop_index(op.f('ix_event_changes_changed_at'), table_name='event_changes')
+    op.drop_index(op.f('ix_event_changes_event_id'), table_name='event_changes')
+    op.drop_table('event_changes')
@@ -0,0 +1,92 @@
+"""Проверка времени импорта app.main (python -X importtime).
+
+Импорт замеряется несколько раз и берется минимум — единичный замер слишком шумный.
+Падает, если минимальное время импорта превышает бюджет или если при импорте
+подтягиваются модули, которые должны грузиться лениво.
+
+Бюджет 1000 мс — с запасом над текущими ~750 мс и ниже ~1.0–1.25 с до переноса
+тяжелых импортов; основную регрессию ловит проверка LAZY_MODULES.
+
+Запуск: uv run python -m scripts.check_importtime [--runs 5] [--budget-ms 1000]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# Тяжелые модули, которые не должны импортироваться при старте воркера
+LAZY_MODULES = [
+    "googleapiclient.discovery",
+    "google.oauth2.credentials",
+    "google_auth_httplib2",
+    "jinja2",
+]
+
+# Заглушки обязательных настроек, чтобы импорт не падал вне docker
+DUMMY_ENV = {
+    "API_KEY": "importtime",
+    "LOGS_LEVEL": "INFO",
+    "CALENDAR_ID": "importtime",
+    "POSTGRES_SERVER": "localhost",
+    "POSTGRES_USER": "postgres",
+    "POSTGRES_PASSWORD": "postgres",
+    "POSTGRES_DB": "postgres",
+}
+
+
+def measure(module: str) -> dict[str, int]:
+    """Возвращает {модуль: cumulative, мкс} для всех импортированных модулей."""
+    env = {**DUMMY_ENV, **os.environ}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if proc.returncode != 0:
+        print(proc.stderr, file=sys.stderr)
+        raise SystemExit(f"Импорт {module} завершился с ошибкой")
+
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # заголовок таблицы
+        timings[parts[2].strip()] = int(parts[1].strip())
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=int(os.environ.get("IMPORT_RUNS", 5)))
+    parser.add_argument(
+        "--budget-ms", type=float, default=float(os.environ.get("IMPORT_BUDGET_MS", 1000))
+    )
+    args = parser.parse_args()
+
+    # Берем самый быстрый прогон: шум (диск, планировщик) только добавляет время
+    samples = [measure(args.module) for _ in range(max(args.runs, 1))]
+    timings = min(samples, key=lambda t: t.get(args.module, 0))
+    total_ms = timings.get(args.module, 0) / 1000
+    all_ms = ", ".join(f"{t.get(args.module, 0) / 1000:.0f}" for t in samples)
+    print(f"{args.module}: {total_ms:.1f} мс (min из [{all_ms}], бюджет {args.budget_ms:.0f} мс)")
+
+    slowest = sorted(timings.items(), key=lambda item: item[1], reverse=True)[:10]
+    for name, cumulative in slowest:
+        print(f"  {cumulative / 1000:8.1f} мс  {name}")
+
+    errors = [f"{name} импортируется при старте" for name in LAZY_MODULES if name in timings]
+    if total_ms > args.budget_ms:
+        errors.append(f"превышен бюджет: {total_ms:.1f} > {args.budget_ms:.0f} мс")
+
+    if errors:
+        for error in errors:
+            print(f"Ошибка: {error}", file=sys.stderr)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()